@@ -2,7 +2,7 @@
 
 from cedarscript_mcp._version import __version__
 
-from .adapters import MCPError, translate_exception
+from .adapters import MCPError, translate_batch, translate_exception
 from .security import PathValidator, SecurityError
 from .server import main
 from .tools import (
@@ -19,5 +19,6 @@ __all__ = [
     "PathValidator",
     "SecurityError",
     "translate_exception",
+    "translate_batch",
     "MCPError",
 ]
@@ -1,10 +1,22 @@
 """Adapters for CEDARScript <-> MCP protocol translation."""
 
+import logging
+import re
 import traceback
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from cedarscript_editor.cedarscript_editor import CEDARScriptEditorException
 
+from .security import SecurityError
+
+try:
+    # Optional C implementation (pip install cedarscript-mcp-server[fast])
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher as _SequenceMatcher
+
+logger = logging.getLogger(__name__)
+
 
 class MCPError:
     """MCP JSON-RPC error codes."""
@@ -21,6 +33,18 @@ class MCPError:
     EXECUTION_ERROR = -32003
 
 
+class MethodNotFoundError(Exception):
+    """Raised when a request names a tool the server does not provide."""
+
+    pass
+
+
+class InvalidParamsError(Exception):
+    """Raised when a request's arguments are missing or malformed."""
+
+    pass
+
+
 def translate_exception(exc: Exception, request_id: Any = None) -> dict:
     """
     Translate Python exceptions to MCP error responses.
@@ -32,106 +56,187 @@ def translate_exception(exc: Exception, request_id: Any = None) -> dict:
     Returns:
         MCP error response dict
     """
-    from .security import SecurityError
-
-    if isinstance(exc, SecurityError):
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "error": {
-                "code": MCPError.SECURITY_ERROR,
-                "message": "Security violation",
-                "data": {
-                    "type": "SecurityError",
-                    "details": str(exc),
-                    "suggestions": [
-                        "Verify the path is within the project root",
-                        "Check file patterns against denylist",
-                        "Ensure server is not in read-only mode (if writing)",
-                    ],
-                },
+    # Walk the MRO so subclasses resolve to the most specific handler
+    for cls in type(exc).__mro__:
+        handler = _EXCEPTION_HANDLERS.get(cls)
+        if handler is not None:
+            return handler(exc, request_id)
+    return _internal_error_response(exc, request_id)
+
+
+def _security_error_response(exc: Exception, request_id: Any) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": MCPError.SECURITY_ERROR,
+            "message": "Security violation",
+            "data": {
+                "type": "SecurityError",
+                "details": str(exc),
+                "suggestions": [
+                    "Verify the path is within the project root",
+                    "Check file patterns against denylist",
+                    "Ensure server is not in read-only mode (if writing)",
+                ],
             },
-        }
-
-    elif isinstance(exc, CEDARScriptEditorException):
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "error": {
-                "code": MCPError.EXECUTION_ERROR,
-                "message": "CEDARScript execution failed",
-                "data": {
-                    "type": "ExecutionError",
-                    "command_index": getattr(exc, "ordinal", None),
-                    "details": str(exc),
-                    "suggestions": _parse_suggestions_from_exception(exc),
-                },
+        },
+    }
+
+
+def _execution_error_response(exc: Exception, request_id: Any) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": MCPError.EXECUTION_ERROR,
+            "message": "CEDARScript execution failed",
+            "data": {
+                "type": "ExecutionError",
+                "command_index": getattr(exc, "ordinal", None),
+                "details": str(exc),
+                "suggestions": _parse_suggestions_from_exception(exc),
             },
-        }
-
-    elif isinstance(exc, ValueError):
-        # Likely a CEDARScript parse error
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "error": {
-                "code": MCPError.PARSE_ERROR_CEDAR,
-                "message": "CEDARScript parse error",
-                "data": {
-                    "type": "ParseError",
-                    "details": str(exc),
-                    "suggestions": [
-                        "Check CEDARScript syntax",
-                        "Valid commands: UPDATE, CREATE, DELETE, MOVE",
-                        "Use parse_cedarscript tool to validate before applying",
-                    ],
-                },
+        },
+    }
+
+
+def _parse_error_response(exc: Exception, request_id: Any) -> dict:
+    # Likely a CEDARScript parse error
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": MCPError.PARSE_ERROR_CEDAR,
+            "message": "CEDARScript parse error",
+            "data": {
+                "type": "ParseError",
+                "details": str(exc),
+                "suggestions": [
+                    "Check CEDARScript syntax",
+                    "Valid commands: UPDATE, CREATE, DELETE, MOVE",
+                    "Use parse_cedarscript tool to validate before applying",
+                ],
             },
-        }
-
-    else:
-        # Generic internal error
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "error": {
-                "code": MCPError.INTERNAL_ERROR,
-                "message": "Internal server error",
-                "data": {
-                    "type": exc.__class__.__name__,
-                    "details": str(exc),
-                    "traceback": traceback.format_exc(),
-                },
+        },
+    }
+
+
+def _internal_error_response(exc: Exception, request_id: Any) -> dict:
+    # Generic internal error
+    data = {
+        "type": exc.__class__.__name__,
+        "details": str(exc),
+    }
+    # Formatting walks every frame; only pay for it when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        data["traceback"] = "".join(traceback.format_exception(exc))
+
+    # Break the exc -> frame -> locals cycle so the frames are freed promptly
+    exc.__traceback__ = None
+
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": MCPError.INTERNAL_ERROR,
+            "message": "Internal server error",
+            "data": data,
+        },
+    }
+
+
+def _method_not_found_response(exc: Exception, request_id: Any) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": MCPError.METHOD_NOT_FOUND,
+            "message": "Method not found",
+            "data": {
+                "type": "MethodNotFound",
+                "details": str(exc),
+                "suggestions": [
+                    "Valid tools: parse_cedarscript, apply_cedarscript, list_capabilities",
+                ],
             },
-        }
+        },
+    }
+
+
+def _invalid_params_response(exc: Exception, request_id: Any) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": MCPError.INVALID_PARAMS,
+            "message": "Invalid params",
+            "data": {
+                "type": "InvalidParams",
+                "details": str(exc),
+            },
+        },
+    }
+
+
+_EXCEPTION_HANDLERS: dict[type, Callable[[Exception, Any], dict]] = {
+    MethodNotFoundError: _method_not_found_response,
+    InvalidParamsError: _invalid_params_response,
+    SecurityError: _security_error_response,
+    CEDARScriptEditorException: _execution_error_response,
+    ValueError: _parse_error_response,
+}
+
+
+def translate_batch(items: list[tuple[Exception | dict, Any]]) -> list[dict]:
+    """
+    Translate a batch of tool outcomes to MCP JSON-RPC responses.
+
+    Args:
+        items: (outcome, request_id) pairs, where outcome is either a tool
+            result dict or the exception the tool raised
+
+    Returns:
+        List of MCP response dicts, in input order
+    """
+    responses = []
+    for outcome, request_id in items:
+        if isinstance(outcome, Exception):
+            responses.append(translate_exception(outcome, request_id))
+        else:
+            responses.append({"jsonrpc": "2.0", "id": request_id, "result": outcome})
+    return responses
+
+
+# Common patterns in CEDARScript exceptions, mapped to suggestions
+_SUGGESTION_RE = re.compile(
+    r"(?P<file_not_found>file not found)|(?P<marker_not_found>marker not found)",
+    re.IGNORECASE,
+)
+_SUGGESTIONS = {
+    "file_not_found": (
+        "Verify the file path is correct",
+        "Check if file exists in project root",
+        "Consider using CREATE command if file should be created",
+    ),
+    "marker_not_found": (
+        "Re-analyze the file structure (it may have changed)",
+        "Use line numbers instead of markers if structure is unstable",
+        "Verify the function/class name is correct",
+    ),
+}
+_DEFAULT_SUGGESTIONS = ("Re-run parse_cedarscript to validate command syntax",)
 
 
 def _parse_suggestions_from_exception(exc: CEDARScriptEditorException) -> list[str]:
     """Extract actionable suggestions from CEDARScript exception."""
-    suggestions = []
-    exc_str = str(exc)
-
-    # Common patterns in CEDARScript exceptions
-    if "file not found" in exc_str.lower():
-        suggestions.extend(
-            [
-                "Verify the file path is correct",
-                "Check if file exists in project root",
-                "Consider using CREATE command if file should be created",
-            ]
-        )
-    elif "marker not found" in exc_str.lower():
-        suggestions.extend(
-            [
-                "Re-analyze the file structure (it may have changed)",
-                "Use line numbers instead of markers if structure is unstable",
-                "Verify the function/class name is correct",
-            ]
-        )
-    else:
-        suggestions.append("Re-run parse_cedarscript to validate command syntax")
-
-    return suggestions
+    match = _SUGGESTION_RE.search(str(exc))
+    return list(_SUGGESTIONS[match.lastgroup] if match else _DEFAULT_SUGGESTIONS)
+
+
+# Command attributes included in serialized output, if the command class has them
+_SERIALIZED_ATTRS = ("target", "action", "content", "segment")
+_serialized_attrs_by_type: dict[type, tuple[str, ...]] = {}
 
 
 def serialize_command(command: Any) -> dict:
@@ -144,42 +249,90 @@ def serialize_command(command: Any) -> dict:
     Returns:
         JSON-serializable dict representation
     """
-    # Simplified serialization - expand based on actual AST structure
-    result = {
-        "type": command.__class__.__name__,
-    }
+    # AST commands are dataclasses, so the attribute set is fixed per class
+    cls = type(command)
+    attrs = _serialized_attrs_by_type.get(cls)
+    if attrs is None:
+        attrs = tuple(attr for attr in _SERIALIZED_ATTRS if hasattr(command, attr))
+        _serialized_attrs_by_type[cls] = attrs
 
-    # Add common fields if they exist
-    for attr in ["target", "action", "content", "segment"]:
-        if hasattr(command, attr):
-            value = getattr(command, attr)
-            # Convert to serializable form
-            if isinstance(value, (str, int, float, bool, type(None))):
-                result[attr] = value
-            elif isinstance(value, list):
-                result[attr] = [str(v) for v in value]
-            else:
-                result[attr] = str(value)
+    result = {"type": cls.__name__}
+    for attr in attrs:
+        result[attr] = _to_serializable(getattr(command, attr))
 
     return result
 
 
+def _to_serializable(value: Any) -> Any:
+    """Convert an AST attribute value to a JSON-serializable form."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return str(value)
+
+
 def generate_diff(original: list[str], modified: list[str], filename: str) -> str:
     """
     Generate unified diff between original and modified content.
 
+    Output matches ``difflib.unified_diff``, with every line newline-terminated;
+    the line matching runs in C when the optional ``cdifflib`` package is installed.
+
     Args:
-        original: Original file lines
-        modified: Modified file lines
+        original: Original file lines (without line terminators)
+        modified: Modified file lines (without line terminators)
         filename: File name for diff header
 
     Returns:
         Unified diff string
     """
-    import difflib
+    return "".join(iter_diff(original, modified, filename))
+
+
+def iter_diff(original: list[str], modified: list[str], filename: str) -> Iterator[str]:
+    """
+    Lazily yield newline-terminated unified diff lines.
+
+    Use this instead of ``generate_diff`` to stream large diffs without
+    holding the whole text in memory.
+
+    Args:
+        original: Original file lines (without line terminators)
+        modified: Modified file lines (without line terminators)
+        filename: File name for diff header
+
+    Yields:
+        Unified diff lines, each ending in a newline
+    """
+    matcher = _SequenceMatcher(None, original, modified)
+    started = False
+    for group in matcher.get_grouped_opcodes(3):
+        if not started:
+            started = True
+            yield f"--- a/{filename}\n"
+            yield f"+++ b/{filename}\n"
+
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@\n"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in original[i1:i2]:
+                    yield f" {line}\n"
+                continue
+            if tag in ("replace", "delete"):
+                for line in original[i1:i2]:
+                    yield f"-{line}\n"
+            if tag in ("replace", "insert"):
+                for line in modified[j1:j2]:
+                    yield f"+{line}\n"
 
-    diff = difflib.unified_diff(
-        original, modified, fromfile=f"a/{filename}", tofile=f"b/{filename}", lineterm=""
-    )
 
-    return "\n".join(diff)
+def _format_range(start: int, stop: int) -> str:
+    """Convert a slice range to unified diff hunk range notation."""
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    if not length:
+        return f"{start},0"
+    return f"{start + 1},{length}"
@@ -1,15 +1,162 @@
 """Security module for CEDARScript MCP Server."""
 
+import os
+import re
+import stat
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
 
+_DEFAULT_DENYLIST: tuple[str, ...] = (
+    ".git/**",
+    "node_modules/**",
+    "__pycache__/**",
+    ".env",
+    "*.env",
+    ".env.*",
+    "credentials.json",
+    "*.key",
+    "*.pem",
+)
+
+# Compiled denylists, shared by validators with the same patterns
+_DENY_RE_CACHE: dict[tuple[str, ...], re.Pattern[str]] = {}
+
+
+# Recently validated roots: absolute root string -> (validation time, resolved path).
+# Lookups are lock-free; inserts and evictions hold _ROOT_CACHE_LOCK.
+_ROOT_CACHE_TTL = 5.0  # seconds
+_ROOT_CACHE_SIZE = 32
+_ROOT_CACHE: dict[str, tuple[float, Path]] = {}
+_ROOT_CACHE_LOCK = threading.Lock()
+
+
 class SecurityError(Exception):
     """Raised when security validation fails."""
 
     pass
 
 
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate a denylist glob into a regex matching posix-style relative paths.
+
+    Mirrors ``PurePath.match`` semantics: relative patterns match from the right
+    (so ``*.env`` also matches ``config/prod.env``), ``*`` and ``?`` never cross
+    a ``/``, and ``**`` matches any number of path segments.
+
+    Unlike ``PurePath.match``, where an absolute pattern never matches a relative
+    path, a leading ``/`` anchors the pattern at root: ``/Makefile`` matches
+    ``Makefile`` but not ``sub/Makefile``.
+
+    Args:
+        pattern: Glob pattern (e.g., '.git/**', '*.key')
+
+    Returns:
+        Regex source (unanchored at the end)
+    """
+    anchored = pattern.startswith("/")
+    if anchored:
+        pattern = pattern.lstrip("/")
+
+    i, n = 0, len(pattern)
+    res = []
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == "*":
+            if i < n and pattern[i] == "*":
+                i += 1
+                res.append(".*")
+            else:
+                res.append("[^/]*")
+        elif c == "?":
+            res.append("[^/]")
+        elif c == "[":
+            # Bracket expressions follow fnmatch.translate, including its pruning of
+            # reversed ranges and escaping of set operations
+            j = i
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                res.append("\\[")
+            else:
+                stuff = pattern[i:j]
+                if "-" not in stuff:
+                    stuff = stuff.replace("\\", r"\\")
+                else:
+                    chunks = []
+                    k = i + 2 if pattern[i] == "!" else i + 1
+                    while True:
+                        k = pattern.find("-", k, j)
+                        if k < 0:
+                            break
+                        chunks.append(pattern[i:k])
+                        i = k + 1
+                        k = k + 3
+                    chunk = pattern[i:j]
+                    if chunk:
+                        chunks.append(chunk)
+                    else:
+                        chunks[-1] += "-"
+                    # Remove empty ranges -- invalid in RE
+                    for k in range(len(chunks) - 1, 0, -1):
+                        if chunks[k - 1][-1] > chunks[k][0]:
+                            chunks[k - 1] = chunks[k - 1][:-1] + chunks[k][1:]
+                            del chunks[k]
+                    # Escape backslashes and hyphens for set difference (--);
+                    # hyphens that create ranges shouldn't be escaped
+                    stuff = "-".join(
+                        s.replace("\\", r"\\").replace("-", r"\-") for s in chunks
+                    )
+                # Escape set operations (&&, ~~ and ||)
+                stuff = re.sub(r"([&~|])", r"\\\1", stuff)
+                i = j + 1
+                if not stuff:
+                    # Empty range: never match
+                    res.append("(?!)")
+                elif stuff == "!":
+                    # Negated empty range: match any character within a segment
+                    res.append("[^/]")
+                else:
+                    if stuff[0] == "!":
+                        # A negated set must not match the segment separator
+                        stuff = "^" + stuff[1:] + "/"
+                    elif stuff[0] in ("^", "["):
+                        stuff = "\\" + stuff
+                    res.append(f"[{stuff}]")
+        else:
+            res.append(re.escape(c))
+
+    return ("" if anchored else "(?:.*/)?") + "".join(res)
+
+
+def _requires_dot_or_slash(pattern: str) -> bool:
+    """Check whether every path matched by a glob must contain '.' or '/'."""
+    # A leading '/' only anchors the pattern and is not part of the matched path
+    literal = re.sub(r"\[!?\]?[^\]]*\]", "", pattern.lstrip("/"))
+    return "." in literal or "/" in literal
+
+
+def _compile_denylist(denylist: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile denylist globs into one alternation; group N+1 is pattern N."""
+    parts = [f"({_translate_glob(p)})" for p in denylist] or ["(?!)"]
+    return re.compile("(?:" + "|".join(parts) + r")\Z", re.DOTALL)
+
+
+def _has_pardir(file_path: str) -> bool:
+    """Check whether a path contains a '..' segment."""
+    if os.altsep:
+        file_path = file_path.replace(os.altsep, os.sep)
+    return os.pardir in file_path.split(os.sep)
+
+
 class PathValidator:
     """Validates file paths against security constraints."""
 
@@ -30,19 +177,18 @@ class PathValidator:
             denylist: List of glob patterns to deny (e.g., ['.git/*', '*.env'])
         """
         self.root = root.resolve()
+        self._root_str = str(self.root)
+        self._root_prefix = os.path.join(self._root_str, "")
         self.read_only = read_only
         self.max_file_size = max_file_size
-        self.denylist = denylist or [
-            ".git/**",
-            "node_modules/**",
-            "__pycache__/**",
-            ".env",
-            "*.env",
-            ".env.*",
-            "credentials.json",
-            "*.key",
-            "*.pem",
-        ]
+        self.denylist = tuple(denylist) if denylist else _DEFAULT_DENYLIST
+        self._deny_re = _DENY_RE_CACHE.get(self.denylist)
+        if self._deny_re is None:
+            self._deny_re = _DENY_RE_CACHE.setdefault(
+                self.denylist, _compile_denylist(self.denylist)
+            )
+        # Plain names (e.g. 'Makefile') can skip the denylist when no pattern matches them
+        self._plain_names_allowed = all(_requires_dot_or_slash(p) for p in self.denylist)
 
         if not self.root.exists():
             raise SecurityError(f"Root directory does not exist: {self.root}")
@@ -63,41 +209,83 @@ class PathValidator:
         Raises:
             SecurityError: If validation fails
         """
-        # Resolve path (handles relative paths, symlinks, ..)
-        if Path(file_path).is_absolute():
-            resolved = Path(file_path).resolve()
+        # '..' after a symlink must be resolved against the link target, as the OS
+        # would, so only paths without it may be normalized lexically
+        if _has_pardir(file_path):
+            resolved_str = os.path.realpath(os.path.join(self._root_str, file_path))
         else:
-            resolved = (self.root / file_path).resolve()
+            norm = os.path.normpath(file_path)
+            if os.path.isabs(norm):
+                candidate = norm
+            elif norm == os.curdir:
+                candidate = self._root_str
+            else:
+                candidate = self._root_prefix + norm
+
+            # Resolve symlinks (and aliases of root) only when the path contains them.
+            # Work on plain strings; a Path is only built once the path is accepted.
+            if self._is_within_root(candidate) and not self._has_symlink_below_root(candidate):
+                resolved_str = candidate
+            else:
+                resolved_str = os.path.realpath(candidate)
 
         # Check path is within root (prevent traversal attacks)
-        try:
-            resolved.relative_to(self.root)
-        except ValueError:
+        if not self._is_within_root(resolved_str):
             raise SecurityError(
                 f"Path escape attempt: '{file_path}' resolves outside root directory"
             )
 
-        # Check denylist
-        relative = resolved.relative_to(self.root)
-        for pattern in self.denylist:
-            if relative.match(pattern):
-                raise SecurityError(
-                    f"Path matches denylist pattern '{pattern}': {file_path}"
-                )
+        # Check denylist against the posix path relative to root
+        rel_str = resolved_str[len(self._root_prefix) :] if resolved_str != self._root_str else ""
+        if os.sep != "/":
+            rel_str = rel_str.replace(os.sep, "/")
+        plain = self._plain_names_allowed and "/" not in rel_str and "." not in rel_str
+        match = None if plain else self._deny_re.match(rel_str)
+        if match:
+            pattern = self.denylist[match.lastindex - 1]
+            raise SecurityError(f"Path matches denylist pattern '{pattern}': {file_path}")
 
         # Check read-only mode
         if for_write and self.read_only:
             raise SecurityError("Write operation rejected: server in read-only mode")
 
-        # Check file size (if exists and reading)
-        if not for_write and resolved.exists() and resolved.is_file():
-            size = resolved.stat().st_size
-            if size > self.max_file_size:
+        # Check file size (if exists and reading) with a single stat call
+        if not for_write:
+            try:
+                st = os.stat(resolved_str)
+            except (FileNotFoundError, NotADirectoryError):
+                st = None
+            if st is not None and stat.S_ISREG(st.st_mode) and st.st_size > self.max_file_size:
                 raise SecurityError(
                     f"File exceeds maximum size ({self.max_file_size} bytes): {file_path}"
                 )
 
-        return resolved
+        return Path(resolved_str)
+
+    def _is_within_root(self, path_str: str) -> bool:
+        """Check whether a normalized absolute path string lies inside root."""
+        return path_str == self._root_str or path_str.startswith(self._root_prefix)
+
+    def _has_symlink_below_root(self, path_str: str) -> bool:
+        """
+        Check whether any component of a path below root is a symlink.
+
+        Root itself is already resolved, so only the components below it are
+        checked, each with an ``lstat`` on every call.
+        """
+        if path_str == self._root_str:
+            return False
+        current = self._root_str
+        for part in path_str[len(self._root_prefix) :].split(os.sep):
+            current = os.path.join(current, part)
+            try:
+                st = os.lstat(current)
+            except (FileNotFoundError, NotADirectoryError):
+                # Nothing below a missing component exists, so nothing to resolve
+                return False
+            if stat.S_ISLNK(st.st_mode):
+                return True
+        return False
 
     def validate_root(self, root: str) -> Path:
         """
@@ -112,11 +300,28 @@ class PathValidator:
         Raises:
             SecurityError: If validation fails
         """
+        # Bursts of tool calls against the same root skip the filesystem entirely
+        # Key on the absolute path so relative roots follow working-directory changes
+        key = os.path.abspath(root)
+        now = time.monotonic()
+        cached = _ROOT_CACHE.get(key)
+        if cached is not None and now - cached[0] < _ROOT_CACHE_TTL:
+            return cached[1]
+
         root_path = Path(root).resolve()
 
-        if not root_path.exists():
+        try:
+            st = os.stat(root_path)
+        except (FileNotFoundError, NotADirectoryError):
             raise SecurityError(f"Root directory does not exist: {root}")
-        if not root_path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             raise SecurityError(f"Root path is not a directory: {root}")
 
+        # Re-insert so the oldest entry is first in iteration order
+        with _ROOT_CACHE_LOCK:
+            _ROOT_CACHE.pop(key, None)
+            _ROOT_CACHE[key] = (now, root_path)
+            if len(_ROOT_CACHE) > _ROOT_CACHE_SIZE:
+                del _ROOT_CACHE[next(iter(_ROOT_CACHE))]
+
         return root_path
@@ -5,12 +5,19 @@ import logging
 import os
 import signal
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
-from .adapters import translate_exception
+from .adapters import (
+    InvalidParamsError,
+    MethodNotFoundError,
+    translate_batch,
+    translate_exception,
+)
 from .security import PathValidator, SecurityError
 from .tools import (
     apply_cedarscript_tool,
@@ -26,17 +33,18 @@ def setup_logging(level: str = "INFO", format: str = "text"):
 
     if format == "json":
         # Structured JSON logging
-        import json
+        from json.encoder import encode_basestring_ascii as quote
 
         class JSONFormatter(logging.Formatter):
+            # Same output as json.dumps on the equivalent dict, without building one
+            template = '{"timestamp": %s, "level": %s, "message": %s, "module": %s}'
+
             def format(self, record):
-                return json.dumps(
-                    {
-                        "timestamp": self.formatTime(record),
-                        "level": record.levelname,
-                        "message": record.getMessage(),
-                        "module": record.module,
-                    }
+                return self.template % (
+                    quote(self.formatTime(record)),
+                    quote(record.levelname),
+                    quote(record.getMessage()),
+                    quote(record.module),
                 )
 
         handler = logging.StreamHandler(sys.stderr)
@@ -65,13 +73,30 @@ mcp = FastMCP("CEDARScript Editor")
 # Global validator (set via CLI args or env)
 _global_validator: Optional[PathValidator] = None
 
+# Per-root validators keyed by absolute root, bounded so clients cannot grow it
+# without limit. Every access reorders or inserts, so all of it holds the lock.
+_VALIDATOR_CACHE_SIZE = 32
+_validator_cache: OrderedDict[str, PathValidator] = OrderedDict()
+_VALIDATOR_CACHE_LOCK = threading.Lock()
+
 
 def get_validator(root: Optional[str] = None) -> PathValidator:
     """Get or create path validator."""
     global _global_validator
 
     if root:
-        return PathValidator(Path(root))
+        # A relative root depends on the working directory at call time
+        key = os.path.abspath(root)
+        with _VALIDATOR_CACHE_LOCK:
+            validator = _validator_cache.get(key)
+            if validator is None:
+                validator = PathValidator(Path(key))
+                _validator_cache[key] = validator
+                if len(_validator_cache) > _VALIDATOR_CACHE_SIZE:
+                    _validator_cache.popitem(last=False)
+            else:
+                _validator_cache.move_to_end(key)
+        return validator
 
     if _global_validator is None:
         # Use environment default
@@ -94,7 +119,7 @@ def parse_cedarscript(content: str) -> dict:
     try:
         return parse_cedarscript_tool(content)
     except Exception as e:
-        logger.error(f"parse_cedarscript failed: {e}")
+        logger.error("parse_cedarscript failed: %s", e)
         raise
 
 
@@ -103,12 +128,12 @@ def apply_cedarscript(
     commands: str, root: str, dry_run: bool = True
 ) -> dict:
     """Apply CEDARScript transformations."""
-    logger.info(f"apply_cedarscript called (root={root}, dry_run={dry_run})")
+    logger.info("apply_cedarscript called (root=%s, dry_run=%s)", root, dry_run)
     try:
         validator = get_validator(root)
         return apply_cedarscript_tool(commands, root, dry_run, validator)
     except Exception as e:
-        logger.error(f"apply_cedarscript failed: {e}")
+        logger.error("apply_cedarscript failed: %s", e)
         raise
 
 
@@ -119,10 +144,58 @@ def list_capabilities() -> dict:
     return list_capabilities_tool()
 
 
+@mcp.tool()
+def batch(calls: list[dict]) -> dict:
+    """Run several parse/apply/list tool calls in one request."""
+    logger.info("batch called (%d calls)", len(calls))
+    outcomes = []
+    for call in calls:
+        request_id = call.get("id") if isinstance(call, dict) else None
+        try:
+            outcomes.append((_run_batch_call(call), request_id))
+        except Exception as e:
+            logger.error("batch call %s failed: %s", request_id, e)
+            outcomes.append((e, request_id))
+    return {"results": translate_batch(outcomes)}
+
+
+# Required arguments of each tool callable through batch
+_BATCH_TOOL_PARAMS = {
+    "parse_cedarscript": ("content",),
+    "apply_cedarscript": ("commands", "root"),
+    "list_capabilities": (),
+}
+
+
+def _run_batch_call(call: dict) -> dict:
+    """Dispatch a single batch entry ({"tool", "arguments", "id"}) to its tool."""
+    if not isinstance(call, dict):
+        raise InvalidParamsError("Batch entry must be an object")
+
+    tool = call.get("tool")
+    args = call.get("arguments") or {}
+    if tool not in _BATCH_TOOL_PARAMS:
+        raise MethodNotFoundError(f"Unknown tool: {tool}")
+    if not isinstance(args, dict):
+        raise InvalidParamsError(f"'arguments' for {tool} must be an object")
+    missing = [name for name in _BATCH_TOOL_PARAMS[tool] if name not in args]
+    if missing:
+        raise InvalidParamsError(f"Missing arguments for {tool}: {', '.join(missing)}")
+
+    if tool == "parse_cedarscript":
+        return parse_cedarscript_tool(args["content"])
+    if tool == "apply_cedarscript":
+        root = args["root"]
+        return apply_cedarscript_tool(
+            args["commands"], root, args.get("dry_run", True), get_validator(root)
+        )
+    return list_capabilities_tool()
+
+
 # Signal handlers for graceful shutdown
 def handle_shutdown(signum, frame):
     """Handle shutdown signals."""
-    logger.info(f"Received signal {signum}, shutting down gracefully")
+    logger.info("Received signal %s, shutting down gracefully", signum)
     sys.exit(0)
 
 
@@ -171,15 +244,15 @@ def main():
     )
 
     logger.info("Starting CEDARScript MCP Server")
-    logger.info(f"  Root: {args.root}")
-    logger.info(f"  Read-only: {args.read_only}")
-    logger.info(f"  Max file size: {args.max_file_size} bytes")
+    logger.info("  Root: %s", args.root)
+    logger.info("  Read-only: %s", args.read_only)
+    logger.info("  Max file size: %s bytes", args.max_file_size)
 
     # Run MCP server with STDIO transport
     try:
         mcp.run(transport="stdio")
     except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -28,11 +28,11 @@ def parse_cedarscript_tool(
         ValueError: If parsing fails
     """
     try:
-        parsed = list(find_commands(content))
+        serialized = [serialize_command(cmd) for cmd in find_commands(content)]
         return {
             "success": True,
-            "count": len(parsed),
-            "commands": [serialize_command(cmd) for cmd in parsed],
+            "count": len(serialized),
+            "commands": serialized,
         }
     except ValueError as e:
         raise ValueError(f"CEDARScript parse error: {e}")
@@ -70,19 +70,17 @@ def apply_cedarscript_tool(
 
     root_path = validator.validate_root(root)
 
-    # Parse commands
-    parsed = list(find_commands(commands))
-
     if dry_run:
-        # Dry-run: Generate preview
+        # Dry-run: Generate preview, serializing commands as they are parsed
         # Note: Full diff generation would require intercepting file writes
         # This is a simplified version
+        serialized = [serialize_command(cmd) for cmd in find_commands(commands)]
         return {
             "success": True,
             "dry_run": True,
             "preview": {
-                "command_count": len(parsed),
-                "commands": [serialize_command(cmd) for cmd in parsed],
+                "command_count": len(serialized),
+                "commands": serialized,
                 "note": "Dry-run mode: Commands parsed successfully. Full diff generation requires execution context.",
             },
         }
@@ -91,6 +89,10 @@ def apply_cedarscript_tool(
         if validator.read_only:
             raise SecurityError("Write operation rejected: server in read-only mode")
 
+        # Parse everything up front so a syntax error in a later block
+        # cannot leave earlier commands half-applied
+        parsed = list(find_commands(commands))
+
         editor = CEDARScriptEditor(str(root_path))
         results = editor.apply_commands(parsed)
 
@@ -107,27 +109,12 @@ def list_capabilities_tool() -> dict:
     List CEDARScript MCP server capabilities.
 
     Returns supported CEDARScript features and server version.
+    The dict is built once at import time and shared; do not mutate it.
 
     Returns:
         dict with capabilities and version info
     """
-    return {
-        "server": "cedarscript-mcp-server",
-        "version": "0.1.0",
-        "cedarscript_editor_version": _get_cedarscript_version(),
-        "features": {
-            "commands": ["UPDATE", "CREATE", "DELETE", "MOVE"],
-            "segments": ["imports", "functions", "classes", "methods"],
-            "actions": ["INSERT", "DELETE", "REPLACE", "MOVE"],
-            "dry_run": True,
-            "tree_sitter": True,
-        },
-        "security": {
-            "path_validation": True,
-            "read_only_mode": True,
-            "file_size_limits": True,
-        },
-    }
+    return _CAPABILITIES
 
 
 def _get_cedarscript_version() -> str:
@@ -138,3 +125,22 @@ def _get_cedarscript_version() -> str:
         return getattr(cedarscript_editor, "__version__", "unknown")
     except Exception:
         return "unknown"
+
+
+_CAPABILITIES = {
+    "server": "cedarscript-mcp-server",
+    "version": "0.1.0",
+    "cedarscript_editor_version": _get_cedarscript_version(),
+    "features": {
+        "commands": ["UPDATE", "CREATE", "DELETE", "MOVE"],
+        "segments": ["imports", "functions", "classes", "methods"],
+        "actions": ["INSERT", "DELETE", "REPLACE", "MOVE"],
+        "dry_run": True,
+        "tree_sitter": True,
+    },
+    "security": {
+        "path_validation": True,
+        "read_only_mode": True,
+        "file_size_limits": True,
+    },
+}
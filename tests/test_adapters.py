@@ -0,0 +1,131 @@
+"""Tests for adapters module."""
+
+import difflib
+import logging
+
+import pytest
+
+from cedarscript_mcp.adapters import MCPError, generate_diff, translate_batch, translate_exception
+
+
+@pytest.mark.parametrize(
+    "original, modified",
+    [
+        (["a", "b", "c"], ["a", "b", "c"]),
+        (["a", "b", "c"], ["a", "x", "c"]),
+        ([], ["new"]),
+        (["old"], []),
+        ([f"line {i}" for i in range(40)], [f"line {i}" for i in range(40) if i % 13]),
+    ],
+)
+def test_generate_diff_matches_difflib(original, modified):
+    """Test that generate_diff output matches difflib.unified_diff line for line."""
+    expected = "".join(
+        line + "\n"
+        for line in difflib.unified_diff(
+            original, modified, fromfile="a/f.py", tofile="b/f.py", lineterm=""
+        )
+    )
+    assert generate_diff(original, modified, "f.py") == expected
+
+
+def _raise_and_catch(exc: Exception) -> Exception:
+    try:
+        raise exc
+    except Exception as e:
+        return e
+
+
+def test_translate_generic_error_omits_traceback():
+    """Test that generic errors carry no traceback unless debugging."""
+    exc = _raise_and_catch(RuntimeError("boom"))
+    response = translate_exception(exc, request_id=7)
+
+    assert response["id"] == 7
+    assert response["error"]["code"] == MCPError.INTERNAL_ERROR
+    assert response["error"]["data"]["type"] == "RuntimeError"
+    assert "traceback" not in response["error"]["data"]
+    assert exc.__traceback__ is None
+
+
+def test_translate_generic_error_traceback_in_debug(caplog):
+    """Test that generic errors include a traceback at DEBUG level."""
+    caplog.set_level(logging.DEBUG, logger="cedarscript_mcp")
+    exc = _raise_and_catch(RuntimeError("boom"))
+    response = translate_exception(exc)
+
+    assert "RuntimeError: boom" in response["error"]["data"]["traceback"]
+
+
+def test_execution_error_suggestions():
+    """Test that execution errors get suggestions matching their message."""
+    from cedarscript_editor.cedarscript_editor import CEDARScriptEditorException
+
+    response = translate_exception(CEDARScriptEditorException(2, "File NOT found: x.py"))
+    data = response["error"]["data"]
+    assert response["error"]["code"] == MCPError.EXECUTION_ERROR
+    assert "Verify the file path is correct" in data["suggestions"]
+
+    response = translate_exception(CEDARScriptEditorException(1, "Marker not found"))
+    assert "Verify the function/class name is correct" in response["error"]["data"]["suggestions"]
+
+    response = translate_exception(CEDARScriptEditorException(1, "something else"))
+    assert response["error"]["data"]["suggestions"] == [
+        "Re-run parse_cedarscript to validate command syntax"
+    ]
+
+
+def test_translate_batch():
+    """Test that batch outcomes map to results and errors in order."""
+    from cedarscript_mcp.security import SecurityError
+
+    responses = translate_batch(
+        [
+            ({"success": True}, 1),
+            (SecurityError("nope"), 2),
+            (RuntimeError("boom"), 3),
+        ]
+    )
+
+    assert [r["id"] for r in responses] == [1, 2, 3]
+    assert responses[0]["result"] == {"success": True}
+    assert responses[1]["error"]["code"] == MCPError.SECURITY_ERROR
+    assert responses[2]["error"]["code"] == MCPError.INTERNAL_ERROR
+
+
+def test_translate_exception_dispatch_subclasses():
+    """Test that exception subclasses map to their nearest handled base."""
+
+    class CustomParseError(ValueError):
+        pass
+
+    response = translate_exception(CustomParseError("bad syntax"))
+    assert response["error"]["code"] == MCPError.PARSE_ERROR_CEDAR
+
+    response = translate_exception(KeyError("missing"))
+    assert response["error"]["code"] == MCPError.INTERNAL_ERROR
+
+
+def test_serialize_command():
+    """Test that commands serialize only the attributes they define."""
+    from dataclasses import dataclass
+
+    from cedarscript_mcp.adapters import serialize_command
+
+    @dataclass
+    class FakeCommand:
+        target: str
+        content: list
+        segment: object
+
+    result = serialize_command(FakeCommand("a.py", [1, 2], 3.5))
+    assert result == {
+        "type": "FakeCommand",
+        "target": "a.py",
+        "content": ["1", "2"],
+        "segment": 3.5,
+    }
+
+    result = serialize_command(FakeCommand("b.py", None, object))
+    assert result["content"] is None
+    assert result["segment"] == str(object)
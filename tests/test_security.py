@@ -1,5 +1,7 @@
 """Tests for security module."""
 
+import shutil
+
 import pytest
 from pathlib import Path
 
@@ -124,3 +126,162 @@ def test_custom_denylist(temp_project_root):
 
     with pytest.raises(SecurityError, match="denylist"):
         validator.validate_path("cache/data.json")
+
+
+def test_denylist_nested_paths(validator):
+    """Test that denylist patterns match at any depth."""
+    with pytest.raises(SecurityError, match=r"denylist pattern '\.git/\*\*'"):
+        validator.validate_path(".git/refs/heads/main")
+
+    with pytest.raises(SecurityError, match=r"denylist pattern '\*\.env'"):
+        validator.validate_path("config/prod.env")
+
+    # Wildcards do not cross directory separators
+    validator.validate_path("src/utils.py")
+
+
+def test_denylist_anchored_pattern(temp_project_root):
+    """Test that a leading '/' anchors a denylist pattern at root."""
+    validator = PathValidator(temp_project_root, denylist=["/utils.py"])
+
+    with pytest.raises(SecurityError, match="denylist"):
+        validator.validate_path("utils.py")
+
+    validator.validate_path("src/utils.py")
+
+
+@pytest.mark.filterwarnings("error")
+def test_denylist_bracket_edge_cases(temp_project_root):
+    """Test that reversed ranges and set operators in brackets compile like fnmatch."""
+    validator = PathValidator(
+        temp_project_root, denylist=["[z-a].txt", "[]-[]", "[!/^]", "x[a&&b].py"]
+    )
+
+    # A reversed range matches nothing
+    validator.validate_path("z.txt")
+
+    with pytest.raises(SecurityError, match=r"denylist pattern '\[!/\^\]'"):
+        validator.validate_path("q")
+
+    with pytest.raises(SecurityError, match="denylist"):
+        validator.validate_path("x&.py")
+
+
+def test_symlink_escape_blocked(validator, temp_project_root, tmp_path):
+    """Test that symlinks pointing outside root are rejected."""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret.txt").write_text("secret\n")
+
+    (temp_project_root / "escape").symlink_to(outside)
+
+    # Validate a regular path under root before the escaping one
+    validator.validate_path("src/utils.py")
+
+    with pytest.raises(SecurityError, match="Path escape"):
+        validator.validate_path("escape/secret.txt")
+
+    with pytest.raises(SecurityError, match="Path escape"):
+        validator.validate_path("escape/secret.txt", for_write=True)
+
+
+def test_normalized_traversal_within_root(validator, temp_project_root):
+    """Test that '..' segments staying inside root are accepted."""
+    resolved = validator.validate_path("src/../myfile.py")
+    assert resolved == temp_project_root / "myfile.py"
+
+
+def test_symlink_added_after_validation(validator, temp_project_root):
+    """Test that a symlink created after its directory was validated is caught."""
+    validator.validate_path("src/utils.py")
+
+    (temp_project_root / "src" / "link.py").symlink_to("/etc/hostname")
+
+    with pytest.raises(SecurityError, match="Path escape"):
+        validator.validate_path("src/link.py")
+
+
+def test_directory_swapped_for_symlink(validator, temp_project_root, tmp_path):
+    """Test that a validated directory later replaced by a symlink is caught."""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret").write_text("secret\n")
+
+    validator.validate_path("src/utils.py")
+
+    shutil.rmtree(temp_project_root / "src")
+    (temp_project_root / "src").symlink_to(outside)
+
+    with pytest.raises(SecurityError, match="Path escape"):
+        validator.validate_path("src/secret")
+
+
+def test_pardir_after_symlink_resolved_like_os(validator, temp_project_root, tmp_path):
+    """Test that '..' after a symlink is resolved against the link target."""
+    outside = tmp_path / "outside" / "inner"
+    outside.mkdir(parents=True)
+    (temp_project_root / "link").symlink_to(outside)
+
+    # The OS resolves 'link/../myfile.py' to 'outside/myfile.py', not 'root/myfile.py'
+    with pytest.raises(SecurityError, match="Path escape"):
+        validator.validate_path("link/../myfile.py")
+
+
+def test_custom_denylist_plain_names(temp_project_root):
+    """Test that denylist patterns without '.' or '/' still match plain names."""
+    validator = PathValidator(temp_project_root, denylist=["Makefile", "*tmp"])
+
+    with pytest.raises(SecurityError, match="denylist"):
+        validator.validate_path("Makefile")
+
+    with pytest.raises(SecurityError, match="denylist"):
+        validator.validate_path("scratch_tmp")
+
+    validator.validate_path("LICENSE")
+
+
+def test_custom_denylist_anchored_plain_name(temp_project_root):
+    """Test that a root-anchored plain name is still checked against the denylist."""
+    validator = PathValidator(temp_project_root, denylist=["/Makefile"])
+
+    with pytest.raises(SecurityError, match="denylist"):
+        validator.validate_path("Makefile")
+
+    validator.validate_path("src/Makefile")
+
+
+def test_default_denylist_shared(temp_project_root, tmp_path):
+    """Test that validators with the same denylist share the compiled regex."""
+    first = PathValidator(temp_project_root)
+    second = PathValidator(tmp_path)
+
+    assert first.denylist is second.denylist
+    assert first._deny_re is second._deny_re
+
+
+def test_root_itself_is_valid(validator, temp_project_root):
+    """Test that the root directory itself validates."""
+    assert validator.validate_path(".") == temp_project_root
+    assert validator.validate_path(str(temp_project_root)) == temp_project_root
+
+
+def test_validate_root_cached(validator, temp_project_root, tmp_path):
+    """Test that validated roots are cached but failures are not."""
+    root = str(temp_project_root)
+    assert validator.validate_root(root) is validator.validate_root(root)
+
+    missing = tmp_path / "later"
+    with pytest.raises(SecurityError, match="does not exist"):
+        validator.validate_root(str(missing))
+
+    missing.mkdir()
+    assert validator.validate_root(str(missing)) == missing
+
+
+def test_validate_root_relative_follows_cwd(validator, temp_project_root, monkeypatch):
+    """Test that a cached relative root is re-resolved after a directory change."""
+    monkeypatch.chdir(temp_project_root)
+    assert validator.validate_root(".") == temp_project_root
+
+    monkeypatch.chdir(temp_project_root / "src")
+    assert validator.validate_root(".") == temp_project_root / "src"
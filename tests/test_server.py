@@ -0,0 +1,59 @@
+"""Tests for MCP server tool wrappers."""
+
+from cedarscript_mcp.adapters import MCPError
+from cedarscript_mcp.server import batch, get_validator
+
+
+def test_batch_mixed_results():
+    """Test that a batch returns results and errors in order without aborting."""
+    response = batch(
+        [
+            {"id": 1, "tool": "list_capabilities"},
+            {
+                "id": 2,
+                "tool": "apply_cedarscript",
+                "arguments": {"commands": "", "root": "/nonexistent/path"},
+            },
+            {"id": 3, "tool": "list_capabilities", "arguments": None},
+        ]
+    )
+    results = response["results"]
+
+    assert [r["id"] for r in results] == [1, 2, 3]
+    assert results[0]["result"]["server"] == "cedarscript-mcp-server"
+    assert results[1]["error"]["code"] == MCPError.SECURITY_ERROR
+    assert results[2]["result"]["server"] == "cedarscript-mcp-server"
+
+
+def test_batch_unknown_tool():
+    """Test that unknown tools map to METHOD_NOT_FOUND."""
+    (result,) = batch([{"id": 1, "tool": "nope"}])["results"]
+
+    assert result["error"]["code"] == MCPError.METHOD_NOT_FOUND
+    assert "nope" in result["error"]["data"]["details"]
+
+
+def test_batch_missing_arguments():
+    """Test that missing or malformed arguments map to INVALID_PARAMS."""
+    results = batch(
+        [
+            {"id": 1, "tool": "apply_cedarscript", "arguments": {"commands": ""}},
+            {"id": 2, "tool": "parse_cedarscript", "arguments": None},
+            {"id": 3, "tool": "parse_cedarscript", "arguments": ["content"]},
+            "not an object",
+        ]
+    )["results"]
+
+    assert [r["error"]["code"] for r in results] == [MCPError.INVALID_PARAMS] * 4
+    assert "root" in results[0]["error"]["data"]["details"]
+    assert "content" in results[1]["error"]["data"]["details"]
+    assert results[3]["id"] is None
+
+
+def test_get_validator_relative_root_follows_cwd(temp_project_root, monkeypatch):
+    """Test that a relative root is looked up against the current directory."""
+    monkeypatch.chdir(temp_project_root)
+    assert get_validator(".").root == temp_project_root
+
+    monkeypatch.chdir(temp_project_root / "src")
+    assert get_validator(".").root == temp_project_root / "src"